@@ -112,15 +112,38 @@ class _BaseFit:
         """
         # evaluate approximate model density
         approx = self.model.evaluate(coeffs, expons)
-        diff = np.abs(self.density - approx)
-        return [
-            self.grid.integrate(approx),
-            self.grid.integrate(diff),
-            np.max(diff),
-            self.grid.integrate(diff**2.0),
-            # TODO: Once measure.py converts classess to functions, then update this.
-            self.grid.integrate(self.density * np.log(self.density / approx))
-        ]
+        return self._goodness_of_fit(approx)
+
+    def _goodness_of_fit(self, approx):
+        r"""
+        Compute the measures of `goodness_of_fit` from the model density evaluated on the grid.
+
+        Parameters
+        ----------
+        approx : ndarray
+            The approximate model density evaluated on the grid points.
+
+        Returns
+        -------
+        list :
+            The integral, :math:`L_1`, :math:`L_\infty`, least-squares and Kullback-Leibler
+            measures as described in `goodness_of_fit`.
+
+        """
+        # integrate all measures with one call, one row per integrand
+        integrands = np.empty((4, approx.size), dtype=np.result_type(self.density, approx))
+        integrands[0] = approx
+        # absolute difference between density & model, computed in place in its row
+        diff = integrands[1]
+        np.subtract(self.density, approx, out=diff)
+        np.abs(diff, out=diff)
+        np.multiply(diff, diff, out=integrands[2])
+        # TODO: Once measure.py converts classess to functions, then update this.
+        np.divide(self.density, approx, out=integrands[3])
+        np.log(integrands[3], out=integrands[3])
+        integrands[3] *= self.density
+        integrals = self.grid.integrate(integrands.T)
+        return [integrals[0], integrals[1], np.max(diff), integrals[2], integrals[3]]
 
 
 class KLDivergenceSCF(_BaseFit):
@@ -170,6 +193,8 @@ class KLDivergenceSCF(_BaseFit):
         self._lm = self.grid.integrate(self.density) / self.norm
         if self._lm == 0. or np.isnan(self._lm):
             raise RuntimeError("Lagrange multiplier cannot be {0}.".format(self._lm))
+        # squared distances used in updating exponents, computed on the first update
+        self._radii_sq = None
 
     @property
     def lagrange_multiplier(self):
@@ -186,7 +211,30 @@ class KLDivergenceSCF(_BaseFit):
         """
         return self._norm
 
-    def _update_params(self, coeffs, expons, update_coeffs=True, update_expons=False):
+    def _get_radii_sq(self):
+        r"""Return squared distance of grid points to the center of each basis function.
+
+        Returns
+        -------
+        radii_sq : ndarray, (N, 1) or (N, `nbasis`)
+            The squared distance of grid points to the center of each basis function. If the
+            model has only one center, a single column is returned to be broadcast.
+
+        """
+        # the model radii do not change during the fit, so these are computed only once
+        if self._radii_sq is None:
+            if self.model.natoms == 1:
+                # case of AtomicGaussianDensity or MolecularGaussianDensity model with 1 atom
+                radii = np.ravel(self.model.radii)[:, None]
+            else:
+                # case of MolecularGaussianDensity model with more than 1 atom
+                centers = [self.model.assign_basis_to_center(i) for i in range(self.model.nbasis)]
+                radii = self.model.radii[centers].T
+            self._radii_sq = radii * radii
+        return self._radii_sq
+
+    def _update_params(self, coeffs, expons, update_coeffs=True, update_expons=False,
+                       basis=None):
         r"""
         Update coefficients & exponents of the Gaussian density model.
 
@@ -202,6 +250,9 @@ class KLDivergenceSCF(_BaseFit):
         update_expons : bool, optional
             Whether to optimize exponents of Gaussian basis functions.
             Default is true.
+        basis : ndarray, (N, `nbasis`), optional
+            The Gaussian basis functions with exponents `expons` evaluated on the grid points,
+            as returned by the `evaluate_basis` method of the model. If `None`, it is computed.
 
         Returns
         -------
@@ -215,24 +266,20 @@ class KLDivergenceSCF(_BaseFit):
         """
         if not update_coeffs and not update_expons:
             raise ValueError("At least one of args update_coeff or update_expons should be True.")
-        # compute model density & its derivative
-        m, dm = self.model.evaluate(coeffs, expons, deriv=True)
+        # compute basis functions (i.e., derivative of model w.r.t. coeffs) & model density
+        if basis is None:
+            basis = self.model.evaluate_basis(expons)
+        m = np.dot(basis, coeffs)
         # compute KL divergence & its derivative
         k, dk = self.measure.evaluate(m, deriv=True)
-        # compute averages needed to update parameters
-        avrg1, avrg2 = np.zeros(self.model.nbasis), np.zeros(self.model.nbasis)
-        for index in range(self.model.nbasis):
-            integrand = -dk * dm[:, index]
-            avrg1[index] = self.grid.integrate(integrand)
-            if update_expons:
-                if self.model.natoms == 1:
-                    # case of AtomicGaussianDensity or MolecularGaussianDensity model with 1 atom
-                    radii = np.ravel(self.model.radii)
-                else:
-                    # case of MolecularGaussianDensity model with more than 1 atom
-                    center_index = self.model.assign_basis_to_center(index)
-                    radii = self.model.radii[center_index]
-                avrg2[index] = self.grid.integrate(integrand * radii**2)
+        # compute averages needed to update parameters (all basis functions at once)
+        integrand = -dk[:, None] * basis
+        # grids may integrate in extended precision, so cast averages to the parameters' type
+        avrg1 = np.asarray(self.grid.integrate(integrand), dtype=np.result_type(coeffs, float))
+        if update_expons:
+            # integrand is not needed after computing avrg1, so it is scaled in place
+            integrand *= self._get_radii_sq()
+            avrg2 = np.asarray(self.grid.integrate(integrand), dtype=np.result_type(expons, float))
 
         # compute updated coeffs & expons
         if update_coeffs:
@@ -296,6 +343,10 @@ class KLDivergenceSCF(_BaseFit):
             raise ValueError("Argument init_expons shape != ({0},)".format(self.model.nbasis))
 
         new_cs, new_es = c0, e0
+        # when exponents are fixed, the basis functions do not change between iterations
+        basis = None
+        if opt_coeffs and not opt_expons:
+            basis = self.model.evaluate_basis(e0)
 
         diff_divergence = np.inf
         max_diff_coeffs = np.inf
@@ -313,7 +364,7 @@ class KLDivergenceSCF(_BaseFit):
             if opt_coeffs and opt_expons:
                 new_cs, new_es = self._update_params(new_cs, new_es, True, True)
             elif opt_coeffs:
-                new_cs, new_es = self._update_params(new_cs, new_es, True, False)
+                new_cs, new_es = self._update_params(new_cs, new_es, True, False, basis)
             elif opt_expons:
                 new_cs, new_es = self._update_params(new_cs, new_es, False, True)
             else:
@@ -322,7 +373,10 @@ class KLDivergenceSCF(_BaseFit):
             max_diff_coeffs = np.max(np.abs(new_cs - old_cs))
             max_diff_expons = np.max(np.abs(new_es - old_es))
             # compute errors & update niter
-            performance.append(self.goodness_of_fit(new_cs, new_es))
+            if basis is None:
+                performance.append(self.goodness_of_fit(new_cs, new_es))
+            else:
+                performance.append(self._goodness_of_fit(np.dot(basis, new_cs)))
             fun.append(performance[-1][-1])
             niter += 1
 
@@ -572,12 +626,13 @@ class ScipyFit(_BaseFit):
         m, dm = self.evaluate_model(x, *args)
         # compute KL divergence
         k, dk = self.measure.evaluate(m, deriv=True)
-        # compute objective function & its derivative
-        obj = self.grid.integrate(self.weights * k)
-        d_obj = np.zeros_like(x)
-        for index in range(len(x)):
-            d_obj[index] = self.grid.integrate(self.weights * dk * dm[:, index])
-        return obj, d_obj
+        # compute objective function & its derivative with one integration, where the first
+        # column is the objective integrand and the rest are the derivative integrands
+        integrand = np.empty((dm.shape[0], dm.shape[1] + 1), dtype=np.result_type(k, dm))
+        np.multiply(self.weights, k, out=integrand[:, 0])
+        np.multiply((self.weights * dk)[:, None], dm, out=integrand[:, 1:])
+        value = self.grid.integrate(integrand)
+        return value[0], value[1:]
 
     def const_norm(self, x, *args):
         r"""Compute deviation in normalization constraint.
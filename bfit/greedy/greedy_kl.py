@@ -77,8 +77,11 @@ class GreedyKL(GreedyStrategy):
         return self.mbis_obj.get_kullback_leibler(model)
 
     def get_best_one_function_solution(self):
-        denom = self.grid.integrate(self.mbis_obj.density * np.power(
-            self.mbis_obj.grid.points ** 2, 2.))
+        # density * r**4 computed in place in a single array
+        integrand = self.mbis_obj.grid.points * self.mbis_obj.grid.points
+        integrand *= integrand
+        integrand *= self.mbis_obj.density
+        denom = self.grid.integrate(integrand)
         exps = 3. * self.norm / (2. * 4. * np.pi * denom)
         return np.array([self.norm, exps])
 
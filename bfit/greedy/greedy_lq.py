@@ -28,7 +28,7 @@ import numpy as np
 from bfit.greedy.greedy_strat import GreedyStrategy
 from bfit.greedy.greedy_utils import get_next_choices
 from bfit.greedy.optimize import optimize_using_nnls, optimize_using_slsqp
-from bfit.model import AtomicGaussianDensity
+from bfit.model import AtomicGaussianDensity, _gaussian_matrix
 
 __all__ = ["GreedyLeastSquares"]
 
@@ -40,46 +40,51 @@ class GreedyLeastSquares(GreedyStrategy):
         self.grid = grid
         self.factor = factor
         self.splitting_func = splitting_func
+        # quantities used for solving the one-function problem, constant over the grid
+        self._grid_sq = grid.points * grid.points
+        self._grid_quart = self._grid_sq * self._grid_sq
+        # quantities depending on the density are computed on first use, see _get_log_density
+        self._log_density = None
+        self._grid_sq_log_density = None
         super(GreedyStrategy, self).__init__()
 
     @property
     def density(self):
         return self.gauss_obj._density
 
+    def _get_log_density(self):
+        # log of density and r**2 times it, computed once from the density attribute
+        if self._log_density is None:
+            self._log_density = np.log(self.density)
+            self._grid_sq_log_density = self._grid_sq * self._log_density
+        return self._log_density, self._grid_sq_log_density
+
     def get_cost_function(self, params):
         self.gauss_obj.cost_function(params)
 
     def _solve_one_function_weight(self, weight):
-        a = 2.0 * np.sum(weight)
-        sum_of_grid_squared = np.sum(weight * np.power(self.grid.points, 2))
-        b = 2.0 * sum_of_grid_squared
-        sum_ln_electron_density = np.sum(weight * np.log(self.density))
-        c = 2.0 * sum_ln_electron_density
+        # weight is either one (N,) weight or a (K, N) stack of weights, solved all at once
+        log_density, grid_sq_log_density = self._get_log_density()
+        a = 2.0 * np.sum(weight, axis=-1)
+        b = 2.0 * np.dot(weight, self._grid_sq)
+        c = 2.0 * np.dot(weight, log_density)
         d = b
-        e = 2.0 * np.sum(weight * np.power(self.grid.points, 4))
-        f = 2.0 * np.sum(weight * np.power(self.grid.points, 2) *
-                         np.log(self.density))
+        e = 2.0 * np.dot(weight, self._grid_quart)
+        f = 2.0 * np.dot(weight, grid_sq_log_density)
         big_a = (b * f - c * e) / (b * d - a * e)
         big_b = (a * f - c * d) / (a * e - b * d)
         coefficient = np.exp(big_a)
         exponent = - big_b
-        return np.array([coefficient, exponent])
+        return np.array([coefficient, exponent]).T
 
     def get_best_one_function_solution(self):
         # Minimizing weighted least squares with three different weights
-        weight1 = np.ones(len(self.grid.points))
-        weight3 = np.power(self.density, 2.)
-        p1 = self._solve_one_function_weight(weight1)
-        cost_func1 = self.gauss_obj.cost_function(p1)
-
-        p2 = self._solve_one_function_weight(self.density)
-        cost_func2 = self.gauss_obj.cost_function(p2)
-
-        p3 = self._solve_one_function_weight(weight3)
-        cost_func3 = self.gauss_obj.cost_function(p3)
-
-        p_min = min([(cost_func1, p1), (cost_func2, p2), (cost_func3, p3)],
-                    key=lambda t: t[0])
+        weights = np.array([np.ones(len(self.grid.points)), self.density,
+                            self.density * self.density])
+        params = self._solve_one_function_weight(weights)
+        costs = np.array([self.gauss_obj.cost_function(p) for p in params])
+        index = np.argmin(costs)
+        p_min = (costs[index], params[index])
 
         # Minimize by analytically finding coefficient.
         val = 1e10
@@ -90,12 +95,12 @@ class GreedyLeastSquares(GreedyStrategy):
                                                                       self.ugbs)
             exp_choice3 = self.gauss_obj.generation_of_UGBS_exponents(1.75,
                                                                       self.ugbs)
-            grid_squared = self.grid.points**2.
+            exps = np.concatenate((exp_choice1, exp_choice2, exp_choice3))
+            # solve for the coefficient of each exponent analytically, all at once
+            gaussians = _gaussian_matrix(exps, self._grid_sq)
+            coeffs = np.dot(self.density, gaussians) / np.sum(gaussians * gaussians, axis=0)
             best_found = None
-            for exp in np.append((exp_choice1, exp_choice2, exp_choice3)):
-                num = np.sum(self.density * np.exp(-exp * grid_squared))
-                den = np.sum(np.exp(-2. * exp * grid_squared))
-                c = num / den
+            for c, exp in zip(coeffs, exps):
                 p = np.array([c, exp])
                 p = self.get_optimization_routine(p)
                 cost_func = self.gauss_obj.cost_function(p)
@@ -42,20 +42,20 @@ def optimize_using_nnls(true_dens, cofactor_matrix):
     r"""
 
     """
-    b_vector = np.copy(true_dens)
-    b_vector = np.ravel(b_vector)
+    # nnls does not modify b, so a flattened view of the density is enough
+    b_vector = np.ravel(true_dens)
     row_nnls_coefficients = nnls(cofactor_matrix, b_vector)
     return row_nnls_coefficients[0]
 
 
 def optimize_using_nnls_valence(true_val_dens, cofactor_matrix):
-    b_vector = np.copy(true_val_dens)
-    b_vector = np.ravel(b_vector)
+    # nnls does not modify b, so a flattened view of the density is enough
+    b_vector = np.ravel(true_val_dens)
     row_nnls_coefficients = nnls(cofactor_matrix, b_vector)
     return row_nnls_coefficients[0]
 
 
-def optimize_using_slsqp(density_model, initial_guess, bounds=None, *args):
+def optimize_using_slsqp(density_model, initial_guess, bounds=None, *args, disp=False):
     r"""Optimize the model via SLSQP.
 
     Works for Kullback-leibler class or DensityModel class.
@@ -70,6 +70,8 @@ def optimize_using_slsqp(density_model, initial_guess, bounds=None, *args):
 
     *args : optional
         Additional arguments for the cost function defined from 'density_model'.
+    disp : bool, optional
+        If true, then the convergence messages of SLSQP are printed. Default is False.
 
     Returns
     -------
@@ -83,7 +85,7 @@ def optimize_using_slsqp(density_model, initial_guess, bounds=None, *args):
 
     if bounds is None:
         bounds = np.array([(0.0, np.inf)] * len(initial_guess))
-    opts = {"maxiter": 100000000, "disp": True, "eps": 1e-10}
+    opts = {"maxiter": 100000000, "disp": disp, "eps": 1e-10}
     f_min_slsqp = minimize(density_model.cost_function,
                            x0=initial_guess, method="SLSQP", bounds=bounds, args=(args),
                            jac=density_model.derivative_of_cost_function,
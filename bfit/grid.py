@@ -85,6 +85,13 @@ class _BaseRadialGrid(OneDGrid):
             raise TypeError("Argument points should be a 1D numpy array.")
         self._points = np.ravel(points)
         self._spherical = spherical
+        # trapezoidal weights, so that integration reduces to a dot product with the integrand
+        dx = np.diff(self._points)
+        self._weights = np.zeros(self._points.shape, dtype=np.result_type(self._points, float))
+        self._weights[:-1] += 0.5 * dx
+        self._weights[1:] += 0.5 * dx
+        # 4 pi r**2 folded into the weights for spherical integration
+        self._sphere_weights = (4. * np.pi) * self._points * self._points * self._weights
 
     @property
     def points(self):
@@ -110,24 +117,27 @@ class _BaseRadialGrid(OneDGrid):
 
         Parameters
         ----------
-        arr : ndarray
-            The integrand evaluated on the radial grid points.
+        arr : ndarray, (N,) or (N, M)
+            The integrand evaluated on the radial grid points. If two-dimensional, each of
+            the `M` columns is integrated separately.
         force_no_spherical : bool
             This forces spherical integration to not occur even if spherical coordinates is
             True, ie the class attribute `_spherical` is True.
 
         Returns
         -------
-        value : float
-            The value of integral.
+        value : float or ndarray, (M,)
+            The value of integral, or the integral of each column of `arr`.
 
         """
-        if arr.shape != self.points.shape:
-            raise ValueError("The argument arr should have {0} shape!".format(self.points.shape))
+        if arr.ndim not in [1, 2] or arr.shape[0] != self.points.shape[0]:
+            raise ValueError(
+                "The argument arr should have ({0},) or ({0}, M) shape!".format(len(self))
+            )
         if self._spherical and not force_no_spherical:
-            value = 4. * np.pi * np.trapz(y=self.points**2 * arr, x=self.points)
+            value = np.dot(self._sphere_weights, arr)
         else:
-            value = np.trapz(y=arr, x=self.points)
+            value = np.dot(self._weights, arr)
         return value
 
 
@@ -238,9 +248,10 @@ class ClenshawRadialGrid(_BaseRadialGrid):
 
         self._atomic_number = atomic_number
 
-        # compute core and diffuse points
-        core_points = self._get_points(num_core_pts, mode="core")
-        diff_points = self._get_points(num_diffuse_pts, mode="diffuse")
+        # compute core and diffuse points, sharing one evaluation of cosine
+        points = self._one_minus_cos(num_core_pts, num_diffuse_pts)
+        core_points = self._scale_points(points[:num_core_pts], mode="core")
+        diff_points = self._scale_points(points[num_core_pts:], mode="diffuse")
 
         # put all points together (0.0 is also contained in diff_points, so it should be removed)
         if extra_pts:
@@ -258,6 +269,29 @@ class ClenshawRadialGrid(_BaseRadialGrid):
         """Return the atomic number."""
         return self._atomic_number
 
+    @staticmethod
+    def _one_minus_cos(*nums_pts):
+        r"""Compute :math:`1 - cos(\frac{\pi p}{2N})` for p=0,1...N-1 for each number of points.
+
+        Parameters
+        ----------
+        nums_pts : int
+            The number of points :math:`N` of each set of points.
+
+        Returns
+        -------
+        values : ndarray, (sum(nums_pts),)
+            The 1D array of values of all sets of points, concatenated in the given order.
+
+        """
+        # angles of all sets are placed in one array, so cosine is evaluated once in place
+        values = np.concatenate(
+            [np.arange(0., num, dtype=np.float128) * (0.5 * np.pi) / num for num in nums_pts]
+        )
+        np.cos(values, out=values)
+        np.subtract(1., values, out=values)
+        return values
+
     def _get_points(self, num_pts, mode="core"):
         r"""Generate radial points on [0, inf) based on Clenshaw-Curtis grid.
 
@@ -284,15 +318,33 @@ class ClenshawRadialGrid(_BaseRadialGrid):
         points : ndarray, (N,)
             The 1D array of grid points.
 
+        """
+        return self._scale_points(self._one_minus_cos(num_pts), mode)
+
+    def _scale_points(self, values, mode):
+        r"""Scale the :math:`1 - cos(\frac{\pi p}{2N})` values to core or diffuse points in place.
+
+        Parameters
+        ----------
+        values : ndarray, (N,)
+            The values returned by `_one_minus_cos`, which are overwritten by the points.
+        mode : str
+            If "core", the values are scaled by :math:`\frac{1}{2Z}`. If "diffuse", the values
+            are scaled by 25.
+
+        Returns
+        -------
+        points : ndarray, (N,)
+            The 1D array of grid points, i.e. the scaled `values` array.
+
         """
         if mode.lower() == "core":
-            points = 1. - np.cos(0.5 * np.pi * np.arange(0., num_pts, dtype=np.float128) / num_pts)
-            points /= 2 * self._atomic_number
+            values /= 2 * self._atomic_number
         elif mode.lower() == "diffuse":
-            points = 25. * (1. - np.cos(0.5 * np.pi * np.arange(0., num_pts, dtype=np.float128) / num_pts))
+            values *= 25.
         else:
             raise ValueError("Arguments mode={0} is not recognized!".format(mode.lower()))
-        return points
+        return values
 
 
 class CubicGrid:
@@ -319,36 +371,31 @@ class CubicGrid:
 
         Parameters
         ----------
-        smallest_pnt : float
-            The smallest point on any axis in the 3D cubic grid.
-        largest_pnt : float
-            The largest point on any axis in the 3D cubic grid.
-        step_size : float
-            The step-size between two consecutive points on any axis in the 3D cubic grid.
+        origin : ndarray, (3,)
+            The Cartesian coordinates of the first grid point.
+        axes : ndarray, (3, 3)
+            The three vectors, stored as rows, spanning one step along each axis of the grid.
+        shape : ndarray, (3,)
+            The number of grid points along each axis.
 
         """
         self._axes = axes
         self._origin = origin
-        dim = self._origin.size
-        # Make an array to store coordinates of grid points
-        self._points = np.zeros((np.prod(shape), dim))
-        coords = np.array(
-            np.meshgrid(
-                np.arange(shape[0]), np.arange(shape[1]), np.arange(shape[2])
-            )
-        )
-        coords = np.swapaxes(coords, 1, 2)
-        coords = coords.reshape(3, -1)
-        points = coords.T.dot(self._axes) + origin
-        # assign the weights
-        weights = self._choose_weight_scheme(shape)
-        self._weights = weights
-        self._points = np.array(points)
+        self._shape = tuple(int(n) for n in shape)
+        # the (N, 3) coordinates are only built when requested, see the points property
+        self._points = None
+        # assign the weight, which is the same for all points
+        self._weight = self._choose_weight_scheme(self._shape)
 
     @property
     def axes(self):
         return self._axes
 
+    @property
+    def shape(self):
+        """Return the number of grid points along each axis."""
+        return self._shape
+
     @classmethod
     def from_molecule(
             cls,
@@ -406,7 +453,9 @@ class CubicGrid:
         # Compute the required number of points along x, y, and z axis
         shape = (max_coordinate - min_coordinate + 2.0 * extension) / spacing
         # Add one to include the upper-bound as well.
-        shape = np.ceil(shape)
+        # Round off floating-point error first, so an exact multiple of the spacing does not get
+        # an extra layer of points (e.g. 4.2 / 0.3 = 14.000000000000002).
+        shape = np.ceil(np.round(shape, decimals=8))
         shape = np.array(shape, int)
         # Compute origin by taking the center of mass then subtracting the half of the number
         #    of points in the direction of the axes.
@@ -432,19 +481,31 @@ class CubicGrid:
 
     def _choose_weight_scheme(self, shape):
         # Choose different weighting schemes.
+        # Points are equally spaced, so a single weight (volume per point) is returned.
         volume = self._calculate_volume(shape)
         numpnt = 1.0 * np.prod(shape)
-        weights = np.full(np.prod(shape), volume / numpnt)
-        return weights
+        return volume / numpnt
 
     @property
     def points(self):
         """Return cubic grid points."""
+        if self._points is None:
+            # point (i, j, k) is i * axes[0] + j * axes[1] + k * axes[2] + origin; each term is
+            # broadcast directly into the output, so no (N, 3) index arrays are created
+            n0, n1, n2 = self._shape
+            points = np.empty((n0, n1, n2, 3))
+            points[...] = np.arange(n0)[:, None, None, None] * self._axes[0]
+            points += np.arange(n1)[None, :, None, None] * self._axes[1]
+            points += np.arange(n2)[None, None, :, None] * self._axes[2]
+            points += self._origin
+            self._points = points.reshape(-1, 3)
+            # the cached points are shared by reference with the models, so make them read-only
+            self._points.setflags(write=False)
         return self._points
 
     def __len__(self):
         """Return the number of grid points."""
-        return self._points.shape[0]
+        return int(np.prod(self._shape))
 
     def integrate(self, arr):
         r"""Compute the integral of a function evaluated on the grid points based on Riemann sums.
@@ -455,16 +516,18 @@ class CubicGrid:
 
         Parameters
         ----------
-        arr : ndarray
-            The integrand evaluated on the grid points.
+        arr : ndarray, (N,) or (N, M)
+            The integrand evaluated on the grid points. If two-dimensional, each of the `M`
+            columns is integrated separately.
 
         Returns
         -------
-        value : float
-            The value of integral.
+        value : float or ndarray, (M,)
+            The value of integral, or the integral of each column of `arr`.
 
         """
-        if arr.shape != (len(self),):
-            raise ValueError("Argument arr should have ({0},) shape.".format(len(self)))
-        value = np.sum(self._weights * arr)
+        if arr.ndim not in [1, 2] or arr.shape[0] != len(self):
+            raise ValueError("Argument arr should have ({0},) or ({0}, M) shape.".format(len(self)))
+        # all weights are equal, so scale the plain sum instead of weighting each point
+        value = self._weight * np.sum(arr, axis=0)
         return value
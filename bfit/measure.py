@@ -25,6 +25,15 @@ import numpy as np
 __all__ = ["KLDivergence", "SquaredDifference"]
 
 
+def _as_contiguous_float(arr):
+    r"""Return array as C-contiguous floating-point array of at least double precision.
+
+    Extended precision arrays (e.g. numpy.longdouble) keep their type, and no copy is made
+    if the array already satisfies these requirements.
+    """
+    return np.ascontiguousarray(arr, dtype=np.result_type(arr, np.float64))
+
+
 class SquaredDifference:
     r"""
     Squared Difference Measure.
@@ -53,7 +62,7 @@ class SquaredDifference:
         """
         if not isinstance(density, np.ndarray) or density.ndim != 1:
             raise ValueError("Arguments density should be a 1D numpy array.")
-        self._density = density
+        self._density = _as_contiguous_float(density)
 
     @property
     def density(self):
@@ -91,13 +100,15 @@ class SquaredDifference:
         """
         if not isinstance(model, np.ndarray) or model.shape != self.density.shape:
             raise ValueError("Argument model should be {0} array.".format(self.density.shape))
+        model = _as_contiguous_float(model)
         # compute residual
         residual = self.density - model
         # compute squared residual
-        value = np.power(residual, 2)
-        # compute derivative of squared residual w.r.t. model
+        value = residual * residual
+        # compute derivative of squared residual w.r.t. model (re-using the residual array)
         if deriv:
-            return value, -2 * residual
+            residual *= -2.
+            return value, residual
         return value
 
 
@@ -130,8 +141,11 @@ class KLDivergence:
             raise ValueError("Arguments density should be a 1D numpy array.")
         if np.any(density < 0.):
             raise ValueError("Argument density should be positive.")
-        self._density = density
+        self._density = _as_contiguous_float(density)
         self._mask_value = mask_value
+        # model values not exceeding this floor are masked in evaluate; like numpy masked division,
+        # this also masks values too small compared to density (i.e. the ratio would overflow)
+        self._ratio_floor = np.maximum(mask_value, np.finfo(float).tiny * self._density)
 
     @property
     def density(self):
@@ -198,16 +212,21 @@ class KLDivergence:
                 f"Number of points in the model {len(model)} should be the same "
                 f"as the number of points in the density {len(self.density)}."
             )
-        if np.any(model < 0.):
+        # a single reduction over model, without creating a boolean array like np.any(model < 0.)
+        if model.size != 0 and model.min() < 0.:
             raise ValueError("Model density is negative and should be non-negative.")
+        model = _as_contiguous_float(model)
 
-        # compute ratio & replace masked values by 1.0
-        ratio = self.density / np.ma.masked_less_equal(model, self.mask_value)
-        ratio = np.ma.filled(ratio, fill_value=1.0)
+        # compute ratio & set masked values to 1.0
+        unmasked = model > self._ratio_floor
+        ratio = np.ones(model.shape, dtype=np.result_type(self.density, model))
+        np.divide(self.density, model, out=ratio, where=unmasked)
 
-        # compute KL divergence
-        value = self.density * np.log(ratio)
-        # compute derivative
+        # compute KL divergence (in place on the logarithm of ratio)
+        value = np.log(ratio)
+        value *= self.density
+        # compute derivative (re-using the ratio array)
         if deriv:
-            return value, -ratio
+            np.negative(ratio, out=ratio)
+            return value, ratio
         return value
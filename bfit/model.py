@@ -84,6 +84,65 @@ from numbers import Integral
 __all__ = ["AtomicGaussianDensity", "MolecularGaussianDensity"]
 
 
+def _gaussian_matrix(expons, radii_sq):
+    r"""
+    Evaluate Gaussian functions :math:`e^{-\alpha_j r_i^2}` for all exponents on all points.
+
+    Parameters
+    ----------
+    expons : ndarray, (M,)
+        The exponents :math:`\alpha_j` of the Gaussian functions.
+    radii_sq : ndarray, (N,)
+        The squared distance :math:`r_i^2` of the grid points from the center.
+
+    Returns
+    -------
+    matrix : ndarray, (N, M)
+        The Gaussian functions evaluated on the grid points, one column per exponent.
+
+    """
+    # exponentiate in place, so only one (N, M) array is allocated
+    matrix = np.outer(radii_sq, -expons)
+    np.exp(matrix, out=matrix)
+    return matrix
+
+
+def _norm_s(expons):
+    r"""
+    Compute normalization constants :math:`(\frac{\alpha}{\pi})^{3/2}` of s-type Gaussian basis.
+
+    Parameters
+    ----------
+    expons : ndarray, (M,)
+        The exponents :math:`\alpha` of the s-type Gaussian functions.
+
+    Returns
+    -------
+    norm : ndarray, (M,)
+        The normalization constant of each s-type Gaussian function.
+
+    """
+    return (expons / np.pi) ** 1.5
+
+
+def _norm_p(expons):
+    r"""
+    Compute normalization constants :math:`\frac{2 \alpha^{5/2}}{3 \pi^{3/2}}` of p-type Gaussians.
+
+    Parameters
+    ----------
+    expons : ndarray, (M,)
+        The exponents :math:`\alpha` of the p-type Gaussian functions :math:`r^2 e^{-\alpha r^2}`.
+
+    Returns
+    -------
+    norm : ndarray, (M,)
+        The normalization constant of each p-type Gaussian function.
+
+    """
+    return (expons**2.5 / np.pi**1.5) / 1.5
+
+
 class AtomicGaussianDensity:
     r"""
     Gaussian density model for modeling the electronic density of a single atom.
@@ -183,6 +242,11 @@ class AtomicGaussianDensity:
         else:
             radii = np.abs(points - self.coord)
         self._radii = np.ravel(radii)
+        # squared radii are needed in every evaluation, so compute them once
+        self._radii_sq = self._radii * self._radii
+        # last evaluated exponents & Gaussian matrix, reused when exponents are unchanged
+        self._cache_expons = None
+        self._cache_matrix = None
 
         self._points = points
         self.ns = num_s
@@ -265,7 +329,7 @@ class AtomicGaussianDensity:
             raise ValueError("Argument coeffs should have size {0}.".format(self.nbasis))
 
         # evaluate all Gaussian basis on the grid, i.e., exp(-a * r**2)
-        matrix = np.exp(-expons[None, :] * np.power(self.radii, 2)[:, None])
+        matrix = self._get_gaussian_matrix(expons)
 
         # compute linear combination of Gaussian basis
         if self.np == 0:
@@ -279,12 +343,71 @@ class AtomicGaussianDensity:
             gs = self._eval_s(matrix[:, :self.ns], coeffs[:self.ns], expons[:self.ns], deriv)
             gp = self._eval_p(matrix[:, self.ns:], coeffs[self.ns:], expons[self.ns:], deriv)
             if deriv:
-                # split derivatives w.r.t. coeffs & expons
-                d_coeffs = np.concatenate((gs[1][:, :self.ns], gp[1][:, :self.np]), axis=1)
-                d_expons = np.concatenate((gs[1][:, self.ns:], gp[1][:, self.np:]), axis=1)
-                return gs[0] + gp[0], np.concatenate((d_coeffs, d_expons), axis=1)
+                # place derivatives w.r.t. coeffs & expons of s-type and p-type basis
+                dg = np.empty((len(self.radii), 2 * self.nbasis))
+                dg[:, :self.ns] = gs[1][:, :self.ns]
+                dg[:, self.ns:self.nbasis] = gp[1][:, :self.np]
+                dg[:, self.nbasis:self.nbasis + self.ns] = gs[1][:, self.ns:]
+                dg[:, self.nbasis + self.ns:] = gp[1][:, self.np:]
+                return gs[0] + gp[0], dg
             return gs + gp
 
+    def evaluate_basis(self, expons):
+        r"""
+        Compute each Gaussian basis function on the grid points.
+
+        This is the derivative of the model w.r.t. the coefficients, so that the model density
+        is the matrix-vector product of this matrix with the coefficients.
+
+        Parameters
+        ----------
+        expons : ndarray, (`nbasis`,)
+            The exponents of `num_s` s-type Gaussian basis functions followed by the
+            exponents of `num_p` p-type Gaussian basis functions.
+
+        Returns
+        -------
+        matrix : ndarray, (N, `nbasis`)
+            The (normalized, if attribute `normalized` is true) Gaussian basis functions
+            evaluated on the grid points, one column per basis function.
+
+        """
+        if expons.ndim != 1 or expons.size != self.nbasis:
+            raise ValueError("Argument expons should be 1D array of size {0}.".format(self.nbasis))
+
+        matrix = np.array(self._get_gaussian_matrix(expons))
+        # multiply r**2 with p-type Gaussian basis, i.e., r**2 * exp(-a * r**2)
+        matrix[:, self.ns:] *= self._radii_sq[:, None]
+        if self.normalized:
+            matrix[:, :self.ns] *= _norm_s(expons[:self.ns])
+            matrix[:, self.ns:] *= _norm_p(expons[self.ns:])
+        return matrix
+
+    def _get_gaussian_matrix(self, expons):
+        r"""
+        Return the exp(-a * r**2) array for the given exponents, re-using the last one computed.
+
+        Optimizers evaluate the model (and its constraints) repeatedly with the same exponents,
+        e.g. when only coefficients are optimized, so the last Gaussian matrix is kept.
+
+        Parameters
+        ----------
+        expons : ndarray, (M,)
+            The exponents of Gaussian basis functions.
+
+        Returns
+        -------
+        matrix : ndarray, (N, M)
+            The read-only exp(-a * r**2) array evaluated on grid points for each exponent.
+
+        """
+        if self._cache_expons is None or not np.array_equal(expons, self._cache_expons):
+            matrix = _gaussian_matrix(expons, self._radii_sq)
+            matrix.setflags(write=False)
+            self._cache_expons = np.array(expons)
+            self._cache_matrix = matrix
+        return self._cache_matrix
+
     def _eval_s(self, matrix, coeffs, expons, deriv):
         """Compute linear combination of s-type Gaussian basis & its derivative on the grid points.
 
@@ -310,22 +433,29 @@ class AtomicGaussianDensity:
             grid points. Only returned if `deriv=True`.
 
         """
-        # normalize Gaussian basis
+        # make linear combination of Gaussian basis on the grid; the normalization constants
+        # are folded into the coefficients, so the (N, M) matrix is not rescaled
         if self.normalized:
-            matrix = matrix * (expons[None, :] / np.pi) ** 1.5
-        # make linear combination of Gaussian basis on the grid
-        g = np.dot(matrix, coeffs)
+            norm = _norm_s(expons)
+            g = np.dot(matrix, coeffs * norm)
+        else:
+            g = np.dot(matrix, coeffs)
 
         # compute derivatives
         if deriv:
+            # keep un-normalized Gaussian basis, needed for the derivative w.r.t. exponents
+            gauss = matrix
+            # normalize Gaussian basis
+            if self.normalized:
+                matrix = matrix * norm[None, :]
             dg = np.zeros((len(self.radii), 2 * coeffs.size))
             # derivative w.r.t. coefficients
             dg[:, :coeffs.size] = matrix
             # derivative w.r.t. exponents
-            dg[:, coeffs.size:] = - matrix * np.power(self.radii, 2)[:, None] * coeffs[None, :]
+            dg[:, coeffs.size:] = - matrix * self._radii_sq[:, None] * coeffs[None, :]
             if self.normalized:
-                matrix = np.exp(-expons[None, :] * np.power(self.radii, 2)[:, None])
-                dg[:, coeffs.size:] += 1.5 * matrix * (coeffs * expons**0.5)[None, :] / np.pi**1.5
+                factor = 1.5 * (coeffs * np.sqrt(expons))[None, :] / np.pi**1.5
+                dg[:, coeffs.size:] += gauss * factor
             return g, dg
         return g
 
@@ -354,28 +484,34 @@ class AtomicGaussianDensity:
             grid points. Only returned if `deriv=True`.
 
         """
+        if not deriv:
+            # r**2 and the normalization constants factor out of the linear combination, so
+            # they are applied to the (N,) result and the (M,) coefficients, respectively
+            if self.normalized:
+                coeffs = coeffs * _norm_p(expons)
+            return self._radii_sq * np.dot(matrix, coeffs)
+
         # multiply r**2 with the evaluated Gaussian basis, i.e., r**2 * exp(-a * r**2)
-        matrix = matrix * np.power(self.radii, 2)[:, None]
+        matrix = matrix * self._radii_sq[:, None]
 
         if not self.normalized:
             # linear combination of p-basis is the same as s-basis with an extra r**2
             return self._eval_s(matrix, coeffs, expons, deriv)
 
+        # keep un-normalized Gaussian basis, needed for the derivative w.r.t. exponents
+        gauss = matrix
         # normalize Gaussian basis
-        matrix = matrix * (expons[None, :]**2.5 / np.pi**1.5) / 1.5
+        matrix = matrix * _norm_p(expons)
         # make linear combination of Gaussian basis on the grid
         g = np.dot(matrix, coeffs)
-        if deriv:
-            dg = np.zeros((len(self.radii), 2 * coeffs.size))
-            # derivative w.r.t. coefficients
-            dg[:, :coeffs.size] = matrix
-            # derivative w.r.t. exponents
-            dg[:, coeffs.size:] = - matrix * np.power(self.radii, 2)[:, None] * coeffs[None, :]
-            matrix = np.exp(-expons[None, :] * np.power(self.radii, 2)[:, None])
-            matrix = matrix * np.power(self.radii, 2)[:, None]
-            dg[:, coeffs.size:] += 5 * matrix * (coeffs * expons**1.5)[None, :] / (3 * np.pi**1.5)
-            return g, dg
-        return g
+        dg = np.zeros((len(self.radii), 2 * coeffs.size))
+        # derivative w.r.t. coefficients
+        dg[:, :coeffs.size] = matrix
+        # derivative w.r.t. exponents
+        dg[:, coeffs.size:] = - matrix * self._radii_sq[:, None] * coeffs[None, :]
+        factor = 5 * (coeffs * expons * np.sqrt(expons))[None, :] / (3 * np.pi**1.5)
+        dg[:, coeffs.size:] += gauss * factor
+        return g, dg
 
 
 class MolecularGaussianDensity:
@@ -509,6 +645,32 @@ class MolecularGaussianDensity:
         index = np.where(np.cumsum(nbasis) >= index + 1)[0][0]
         return index
 
+    def evaluate_basis(self, expons):
+        r"""
+        Compute each Gaussian basis function of every center on the grid points.
+
+        This is the derivative of the model w.r.t. the coefficients, so that the model density
+        is the matrix-vector product of this matrix with the coefficients.
+
+        Parameters
+        ----------
+        expons : ndarray, (`nbasis`,)
+            The exponents of Gaussian basis functions ordered by center, as in `evaluate`.
+
+        Returns
+        -------
+        matrix : ndarray, (N, `nbasis`)
+            The Gaussian basis functions evaluated on the grid points, one column per
+            basis function.
+
+        """
+        if expons.ndim != 1 or expons.size != self.nbasis:
+            raise ValueError("Argument expons should be 1D array of size {0}.".format(self.nbasis))
+        # split exponents among the centers
+        split = np.cumsum([center.nbasis for center in self.center])[:-1]
+        es = np.split(expons, split)
+        return np.concatenate([c.evaluate_basis(e) for c, e in zip(self.center, es)], axis=1)
+
     def evaluate(self, coeffs, expons, deriv=False):
         r"""Compute linear combination of Gaussian basis & its derivatives on the grid points.
 
@@ -23,6 +23,7 @@
 
 
 import numpy as np
+import pytest
 from numpy.testing import assert_almost_equal, assert_equal, assert_raises
 
 from bfit.model import AtomicGaussianDensity, MolecularGaussianDensity
@@ -30,6 +31,22 @@ from bfit.fit import KLDivergenceSCF, ScipyFit
 from bfit.grid import UniformRadialGrid, CubicGrid
 
 
+@pytest.fixture(scope="module")
+def grid():
+    # radial grid shared by the tests of this module; grids are not modified by fitting
+    return UniformRadialGrid(150, 0.0, 15.0, spherical=True)
+
+
+@pytest.fixture(scope="module")
+def kl_1s():
+    # 1s Slater density fitted by one unnormalized s-type Gaussian, shared by the tests of this
+    # module; fitting does not modify the grid, density or model
+    g = UniformRadialGrid(1000, 0.0, 10.0, spherical=True)
+    e = np.exp(-g.points)
+    m = AtomicGaussianDensity(g.points, num_s=1, num_p=0, normalize=False)
+    return KLDivergenceSCF(g, e, m, mask_value=0.)
+
+
 def test_lagrange_multiplier():
     g = UniformRadialGrid(150, 1e-4, 15.0, spherical=True)
     e = np.exp(-g.points)
@@ -37,21 +54,14 @@ def test_lagrange_multiplier():
     assert_almost_equal(kl.lagrange_multiplier, 1., decimal=8)
 
 
-def test_goodness_of_fit():
-    g = UniformRadialGrid(1000, 0.0, 10.0, spherical=True)
-    e = np.exp(-g.points)
-    m = AtomicGaussianDensity(g.points, num_s=1, num_p=0, normalize=False)
-    kl = KLDivergenceSCF(g, e, m, mask_value=0.)
-    gf = kl.goodness_of_fit(np.array([1.]), np.array([1.]))
+def test_goodness_of_fit(kl_1s):
+    gf = kl_1s.goodness_of_fit(np.array([1.]), np.array([1.]))
     expected = [5.56833, 4 * np.pi * 1.60909, 0.128, 4. * np.pi * 17.360]
     assert_almost_equal(expected, gf, decimal=1)
 
 
-def test_assertion_raises():
-    g = UniformRadialGrid(1000, 0.0, 10.0, spherical=True)
-    e = np.exp(-g.points)
-    m = AtomicGaussianDensity(g.points, num_s=1, num_p=0, normalize=False)
-    kl = KLDivergenceSCF(g, e, m, mask_value=0.)
+def test_assertion_raises(kl_1s):
+    kl, g, e, m = kl_1s, kl_1s.grid, kl_1s.density, kl_1s.model
     assert_raises(ValueError, kl._update_params, None, None, False, False)
     assert_raises(ValueError, kl.run, np.array([1., 2.]), np.array([1.]))
     assert_raises(ValueError, kl.run, np.array([1.]), np.array([1., 2.]))
@@ -79,7 +89,9 @@ def test_run_normalized_1s_gaussian():
 
     # fit density with initial coeff=1. & expon=1.
     res = kl.run(np.array([1.]), np.array([1.]), True, True, 500, 1.e-4, 1.e-4, 1.e-4)
-    # check optimized coeffs & expons
+    # check optimized coeffs & expons keep the type of the initial guess
+    assert_equal(res["x"][0].dtype, np.float64)
+    assert_equal(res["x"][1].dtype, np.float64)
     assert_almost_equal(np.array([1.]), res["x"][0], decimal=8)
     assert_almost_equal(np.array([1.]), res["x"][1], decimal=8)
     # check value of optimized objective function & fitness measure
@@ -114,9 +126,8 @@ def test_run_normalized_1s_gaussian():
     assert_almost_equal(0., res["fun"][-1], decimal=10)
 
 
-def test_kl_scf_update_coeffs_2s_gaussian():
+def test_kl_scf_update_coeffs_2s_gaussian(grid):
     # actual density is a 1s Slater function
-    grid = UniformRadialGrid(150, 0.0, 15.0, spherical=True)
     c, e = np.array([5., 2.]), np.array([10., 3.])
     dens = np.exp(-grid.points, dtype=np.float128)
     # model density is a normalized 2s Gaussian basis
@@ -161,9 +172,8 @@ def test_kl_scf_update_params_2s_gaussian():
     assert_almost_equal(new_expons, expons, decimal=6)
 
 
-def test_kl_scf_update_params_1s1p_gaussian():
+def test_kl_scf_update_params_1s1p_gaussian(grid):
     # actual density is a 1s Slater function
-    grid = UniformRadialGrid(150, 0.0, 15.0, spherical=True)
     points = grid.points
     c, e = np.array([1., 2.]), np.array([3., 4.])
     dens = np.exp(-grid.points)
@@ -269,9 +279,8 @@ def test_kl_scf_run_3d_molecular_dens_1s_1p_gaussian():
     assert_almost_equal(result["fun"][-1], 0., decimal=6)
 
 
-def test_kl_fit_unnormalized_dens_normalized_1s_gaussian():
+def test_kl_fit_unnormalized_dens_normalized_1s_gaussian(grid):
     # density is normalized 1s orbital with exponent=1.0
-    grid = UniformRadialGrid(150, 0.0, 15.0, spherical=True)
     # density is normalized 1s gaussian
     dens = 1.57 * np.exp(-0.51 * grid.points**2.)
     model = AtomicGaussianDensity(grid.points, num_s=1, num_p=0, normalize=True)
@@ -344,9 +353,8 @@ def test_kl_fit_normalized_dens_unnormalized_1s_gaussian():
     assert_almost_equal(0., result["fun"], decimal=10)
 
 
-def test_kl_fit_normalized_dens_normalized_1s_gaussian():
+def test_kl_fit_normalized_dens_normalized_1s_gaussian(grid):
     # density is normalized 1s gaussian
-    grid = UniformRadialGrid(150, 0.0, 15.0, spherical=True)
     dens = 2.06 * (0.88 / np.pi)**1.5 * np.exp(-0.88 * grid.points**2.)
     # normalized 1s basis function
     model = AtomicGaussianDensity(grid.points, num_s=1, num_p=0, normalize=True)
@@ -455,9 +463,8 @@ def test_kl_fit_normalized_dens_normalized_2p_gaussian():
     assert_almost_equal(np.array([-1., -1.]), result["jacobian"], decimal=6)
 
 
-def test_kl_fit_normalized_dens_normalized_1s2p_gaussian():
+def test_kl_fit_normalized_dens_normalized_1s2p_gaussian(grid):
     # density is normalized 1s + 2p gaussians
-    grid = UniformRadialGrid(150, 0.0, 15.0, spherical=True)
     points = grid.points
     cs0 = np.array([1.52, 0.76, 3.09])
     es0 = np.array([0.50, 2.01, 0.83])
@@ -493,9 +500,8 @@ def test_kl_fit_normalized_dens_normalized_1s2p_gaussian():
     assert_almost_equal(np.array([0., 0., 0.]), result["jacobian"], decimal=6)
 
 
-def test_kl_fit_unnormalized_1d_molecular_dens_unnormalized_1s_1s_gaussian():
+def test_kl_fit_unnormalized_1d_molecular_dens_unnormalized_1s_1s_gaussian(grid):
     # density is normalized 1s + 1s gaussians
-    grid = UniformRadialGrid(150, 0.0, 15.0, spherical=True)
     points = grid.points
     cs0 = np.array([1.52, 2.67])
     es0 = np.array([0.31, 0.41])
@@ -541,9 +547,8 @@ def test_kl_fit_unnormalized_1d_molecular_dens_unnormalized_1s_1s_gaussian():
     assert_almost_equal(0., result["fun"], decimal=10)
 
 
-def test_kl_fit_unnormalized_1d_molecular_dens_unnormalized_1s_1p_gaussian():
+def test_kl_fit_unnormalized_1d_molecular_dens_unnormalized_1s_1p_gaussian(grid):
     # density is normalized 1s + 1s gaussians
-    grid = UniformRadialGrid(150, 0.0, 15.0, spherical=True)
     points = grid.points
     cs0 = np.array([1.52, 2.67])
     es0 = np.array([0.31, 0.41])
@@ -24,7 +24,7 @@
 
 import numpy as np
 
-from numpy.testing import assert_raises, assert_almost_equal
+from numpy.testing import assert_raises, assert_almost_equal, assert_equal
 
 from bfit.grid import _BaseRadialGrid, UniformRadialGrid, ClenshawRadialGrid, CubicGrid
 
@@ -57,6 +57,40 @@ def test_raises_integration():
     assert_raises(ValueError, grid.integrate, arr)
 
 
+def test_integration_base_non_uniform():
+    # compare trapezoidal weights against numpy's trapezoidal rule on a non-uniform grid
+    points = np.linspace(0., 10., 500)**2 / 10.
+    grid = _BaseRadialGrid(points, spherical=True)
+    arr = np.exp(-points)
+    assert_almost_equal(grid.integrate(arr), 4. * np.pi * np.trapz(points**2 * arr, points),
+                        decimal=8)
+    assert_almost_equal(grid.integrate(arr, force_no_spherical=True), np.trapz(arr, points),
+                        decimal=8)
+    # single point grid has zero integral
+    assert_almost_equal(_BaseRadialGrid(np.array([1.])).integrate(np.array([2.])), 0., decimal=8)
+    # grid with integer points
+    points = np.arange(10)
+    grid = _BaseRadialGrid(points, spherical=True)
+    arr = np.exp(-0.1 * points)
+    assert_almost_equal(grid.integrate(arr), 4. * np.pi * np.trapz(points**2 * arr, points),
+                        decimal=8)
+    assert_almost_equal(grid.integrate(arr, force_no_spherical=True), np.trapz(arr, points),
+                        decimal=8)
+
+
+def test_integration_base_multiple_columns():
+    # integrate several functions at once and compare with integrating them one by one
+    grid = _BaseRadialGrid(np.arange(0., 5., 0.001), spherical=True)
+    arr = np.array([np.exp(-grid.points), grid.points, np.ones(len(grid))]).T
+    expected = [grid.integrate(arr[:, i]) for i in range(3)]
+    assert_almost_equal(grid.integrate(arr), expected, decimal=8)
+    expected = [grid.integrate(arr[:, i], force_no_spherical=True) for i in range(3)]
+    assert_almost_equal(grid.integrate(arr, force_no_spherical=True), expected, decimal=8)
+    # check number of points
+    assert_raises(ValueError, grid.integrate, arr[:-1])
+    assert_raises(ValueError, grid.integrate, arr[:, :, None])
+
+
 def test_raises_clenshaw():
     assert_raises(TypeError, ClenshawRadialGrid, 10.1, 1, 1, [])
     assert_raises(TypeError, ClenshawRadialGrid, -10, 1, 1, [])
@@ -310,3 +344,34 @@ def test_integration_cubic_gaussian_shifted():
     value = (0.5 / np.pi)**1.5 * np.exp(-0.5 * dist**2) + 3.62 * dist**2 * np.exp(-0.85 * dist**2)
     value = grid.integrate(value)
     assert_almost_equal(value, 1.0 + 3.62 * 1.5 * (np.pi**1.5 / 0.85**2.5), decimal=6)
+
+
+def test_points_cubic_origin_axes_shape():
+    grid = CubicGrid(np.array([0., 0., 0.]), 0.5 * np.eye(3), np.array([3, 3, 3]))
+    assert_equal(grid.shape, (3, 3, 3))
+    assert_equal(len(grid), 27)
+    # integrate constant value of 1. over the cube of side 3 * 0.5
+    assert_almost_equal(grid.integrate(np.ones(len(grid))), 1.5**3, decimal=8)
+    desired_answer = [[0.0, 0.0, 0.], [0.0, 0.0, 0.5], [0.0, 0.0, 1.],
+                      [0.0, 0.5, 0.], [0.0, 0.5, 0.5], [0.0, 0.5, 1.],
+                      [0.0, 1.0, 0.], [0.0, 1.0, 0.5], [0.0, 1.0, 1.],
+                      [0.5, 0.0, 0.], [0.5, 0.0, 0.5], [0.5, 0.0, 1.],
+                      [0.5, 0.5, 0.], [0.5, 0.5, 0.5], [0.5, 0.5, 1.],
+                      [0.5, 1.0, 0.], [0.5, 1.0, 0.5], [0.5, 1.0, 1.],
+                      [1.0, 0.0, 0.], [1.0, 0.0, 0.5], [1.0, 0.0, 1.],
+                      [1.0, 0.5, 0.], [1.0, 0.5, 0.5], [1.0, 0.5, 1.],
+                      [1.0, 1.0, 0.], [1.0, 1.0, 0.5], [1.0, 1.0, 1.]]
+    assert_almost_equal(grid.points, desired_answer, decimal=8)
+    # points are built once and shared as a read-only array
+    assert grid.points is grid.points
+    assert not grid.points.flags.writeable
+
+
+def test_cubic_from_molecule_shape_exact_multiple_of_spacing():
+    # 2 * extension / spacing = 4.2 / 0.3 is 14 up to floating-point error
+    grid = CubicGrid.from_molecule(
+        np.array([1.]), np.array([[0., 0., 0.]]), spacing=0.3, extension=2.1, rotate=False
+    )
+    assert_equal(grid.shape, (14, 14, 14))
+    assert_equal(len(grid), 14**3)
+    assert_almost_equal(grid.integrate(np.ones(len(grid))), 4.2**3, decimal=8)
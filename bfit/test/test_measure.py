@@ -117,3 +117,34 @@ def test_evaluate_squared_difference():
     assert_almost_equal(m, measure.evaluate(model, deriv=False), decimal=8)
     assert_almost_equal(m, measure.evaluate(model, deriv=True)[0], decimal=8)
     assert_almost_equal(dm, measure.evaluate(model, deriv=True)[1], decimal=8)
+
+
+def test_measures_non_contiguous_and_integer_arrays():
+    # density & model given as strided views or integer arrays give the same result
+    dens = np.linspace(0.0, 10., 30)
+    model = np.linspace(0.0, 12., 30)
+    for measure in [KLDivergence, SquaredDifference]:
+        expected = measure(dens[::2]).evaluate(model[::2].copy(), deriv=True)
+        result = measure(dens[::2]).evaluate(model[::2], deriv=True)
+        assert measure(dens[::2]).density.flags["C_CONTIGUOUS"]
+        assert_almost_equal(expected[0], result[0], decimal=8)
+        assert_almost_equal(expected[1], result[1], decimal=8)
+        # integer density is used as floating-point array
+        assert measure(np.array([1, 2, 3])).density.dtype == np.float64
+        assert_almost_equal(measure(np.array([1, 2, 3])).evaluate(np.array([1, 2, 3])),
+                            np.zeros(3), decimal=8)
+
+
+def test_evaluate_kl_mixed_precision():
+    # float64 density with an extended precision model keeps the wider type
+    measure = KLDivergence(np.array([1., 2., 3.]))
+    model = np.array([1., 2., 3.], dtype=np.longdouble) * (1 + np.longdouble(1e-18))
+    value, deriv = measure.evaluate(model, deriv=True)
+    assert value.dtype == np.longdouble
+    assert deriv.dtype == np.longdouble
+    dens = np.array([1., 2., 3.], dtype=np.longdouble)
+    assert_almost_equal(value / 1e-18, dens * np.log(dens / model) / 1e-18, decimal=8)
+    # values are about -1e-18 times the density, which float64 would round to zero
+    assert np.all(value < 0.)
+    assert_almost_equal(value / 1e-18, -np.array([1., 2., 3.]), decimal=0)
+    assert_almost_equal(deriv, -dens / model, decimal=8)
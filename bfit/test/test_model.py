@@ -44,6 +44,10 @@ def test_raises_gaussian_model():
     assert_raises(ValueError, AtomicGaussianDensity, np.array([0.]), [1.], 1, 0, True)
     assert_raises(ValueError, AtomicGaussianDensity, np.array([0.]), np.array([[1.]]), 1, 0, True)
     assert_raises(ValueError, AtomicGaussianDensity, np.array([[0.]]), np.array([1., 2.]), 1)
+    # check exponents of basis functions
+    model = AtomicGaussianDensity(np.array([0., 1.]), None, 1, 1, False)
+    assert_raises(ValueError, model.evaluate_basis, np.array([1.]))
+    assert_raises(ValueError, model.evaluate_basis, np.array([[1., 2.]]))
     # test on molecular density.
     assert_raises(ValueError, MolecularGaussianDensity, np.array([0.]), np.array([1.]), [1, 1])
     assert_raises(ValueError, MolecularGaussianDensity,
@@ -579,6 +583,7 @@ def test_gaussian_2s2p_basis_multiple_point():
     assert_almost_equal(g, model.evaluate(coeffs, expons, deriv=False), decimal=8)
     assert_almost_equal(g, model.evaluate(coeffs, expons, deriv=True)[0], decimal=8)
     assert_almost_equal(dg, model.evaluate(coeffs, expons, deriv=True)[1], decimal=8)
+    assert_almost_equal(dg[:, :4], model.evaluate_basis(expons), decimal=8)
     # normalized
     g = np.array([-6.8644186384, -1.2960445644, 0.0614559599,
                   0.0423855159, 0.0025445224, 0.0003531182])
@@ -599,6 +604,23 @@ def test_gaussian_2s2p_basis_multiple_point():
     assert_almost_equal(g, model.evaluate(coeffs, expons, deriv=False), decimal=8)
     assert_almost_equal(g, model.evaluate(coeffs, expons, deriv=True)[0], decimal=8)
     assert_almost_equal(dg, model.evaluate(coeffs, expons, deriv=True)[1], decimal=8)
+    assert_almost_equal(dg[:, :4], model.evaluate_basis(expons), decimal=8)
+
+
+def test_gaussian_model_reevaluate_changed_exponents():
+    # evaluating again after changing the exponents (even in-place) gives the new model
+    points = np.array([0., -0.71, 1.68, -2.03, 3.12, 4.56])
+    coeffs = np.array([0.53, -6.1, -2.0, 4.3])
+    expons = np.array([0.11, 3.4, 1.5, 0.78])
+    model = AtomicGaussianDensity(points, num_s=2, num_p=2, normalize=True)
+    g, dg = model.evaluate(coeffs, expons, deriv=True)
+    assert_almost_equal(g, model.evaluate(coeffs, expons), decimal=8)
+    assert_almost_equal(dg[:, :4], model.evaluate_basis(expons), decimal=8)
+    expons *= 2.
+    expected = AtomicGaussianDensity(points, num_s=2, num_p=2, normalize=True)
+    assert_almost_equal(expected.evaluate(coeffs, expons, deriv=True)[1],
+                        model.evaluate(coeffs, expons, deriv=True)[1], decimal=8)
+    assert_almost_equal(expected.evaluate_basis(expons), model.evaluate_basis(expons), decimal=8)
 
 
 def test_molecular_gaussian_density_1d_1center_1s():
@@ -868,6 +890,7 @@ def test_molecular_gaussian_density_3d_3center_2s1p_1p_2s():
     assert_almost_equal(g, model.evaluate(coeffs, expons, deriv=False), decimal=8)
     assert_almost_equal(g, model.evaluate(coeffs, expons, deriv=True)[0], decimal=8)
     assert_almost_equal(dg, model.evaluate(coeffs, expons, deriv=True)[1], decimal=8)
+    assert_almost_equal(dg[:, :6], model.evaluate_basis(expons), decimal=8)
     # normalized (2s1p) & (1p) & (1s) basis functions
     model = MolecularGaussianDensity(points, coords, basis=basis, normalize=True)
     # check basis
@@ -898,6 +921,7 @@ def test_molecular_gaussian_density_3d_3center_2s1p_1p_2s():
     assert_almost_equal(g, model.evaluate(coeffs, expons, deriv=False), decimal=8)
     assert_almost_equal(g, model.evaluate(coeffs, expons, deriv=True)[0], decimal=8)
     assert_almost_equal(dg, model.evaluate(coeffs, expons, deriv=True)[1], decimal=8)
+    assert_almost_equal(dg[:, :6], model.evaluate_basis(expons), decimal=8)
 
 
 def test_gaussian_model_s_integrate_uniform():